@@ -43,7 +43,7 @@ stripe.api_key = _env('STRIPE_RESTRICTED_KEY', 'STRIPE_SECRET_KEY')
 CHESSBLUNDERS_PRODUCT_ID = _env('STRIPE_PRODUCT_ID')
 MONTHLY_PRICE_ID = _env('STRIPE_MONTHLY_PRICE_ID')   # $4.99 / month
 YEARLY_PRICE_ID = _env('STRIPE_YEARLY_PRICE_ID')     # $39.99 / year
-CHESSBLUNDERS_PRICE_IDS = {p for p in (MONTHLY_PRICE_ID, YEARLY_PRICE_ID) if p}
+CHESSBLUNDERS_PRICE_IDS = frozenset(p for p in (MONTHLY_PRICE_ID, YEARLY_PRICE_ID) if p)
 
 
 def plan_for_price(price_id):
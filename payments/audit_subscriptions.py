@@ -32,20 +32,34 @@ ACTIVE_DB_STATUSES = {'active', 'trialing'}
 
 
 def get_stripe_subscribed_users():
+    # The Stripe account is shared across apps, so let Stripe do the price
+    # filtering (one list call per ChessBlunders price id) instead of paging
+    # every active subscription and discarding the foreign ones client-side.
+    # Dedupe by subscription id in case a sub ever carries both prices.
     results = []
-    has_more = True
-    starting_after = None
-
-    while has_more:
-        params = {'limit': 100, 'status': 'active', 'expand': ['data.customer']}
-        if starting_after:
-            params['starting_after'] = starting_after
-
-        batch = stripe.Subscription.list(**params)
-
-        for sub in batch.data:
-            price_id = sub['items']['data'][0]['price']['id'] if sub['items']['data'] else None
-            if price_id and price_id in CHESSBLUNDERS_PRICE_IDS:
+    seen_sub_ids = set()
+
+    for wanted_price_id in sorted(CHESSBLUNDERS_PRICE_IDS):
+        has_more = True
+        starting_after = None
+
+        while has_more:
+            params = {
+                'limit': 100,
+                'status': 'active',
+                'price': wanted_price_id,
+                'expand': ['data.customer'],
+            }
+            if starting_after:
+                params['starting_after'] = starting_after
+
+            batch = stripe.Subscription.list(**params)
+
+            for sub in batch.data:
+                if sub['id'] in seen_sub_ids:
+                    continue
+                seen_sub_ids.add(sub['id'])
+                price_id = sub['items']['data'][0]['price']['id'] if sub['items']['data'] else None
                 customer = sub['customer']
                 email = sget(customer, 'email', '???') or '???'
                 cust_id = sget(customer, 'id') or sub['customer']
@@ -68,9 +82,9 @@ def get_stripe_subscribed_users():
                     'status': sub['status'],
                 })
 
-        has_more = batch.has_more
-        if batch.data:
-            starting_after = batch.data[-1].id
+            has_more = batch.has_more
+            if batch.data:
+                starting_after = batch.data[-1].id
 
     return results
 
@@ -6,19 +6,26 @@ from _common import stripe as _stripe  # noqa: F401
 
 
 def main():
+    # The Stripe account is shared across apps: without a price id the price=
+    # filter below would be dropped and every active sub would be listed.
+    if not MONTHLY_PRICE_ID:
+        raise SystemExit('STRIPE_MONTHLY_PRICE_ID not configured')
+
     emails = []
     starting_after = None
     while True:
-        params = {"limit": 100, "status": "active", "expand": ["data.customer"]}
+        # price= makes Stripe return only monthly ChessBlunders subs, instead
+        # of paging every active sub on the shared account and filtering here.
+        params = {
+            "limit": 100,
+            "status": "active",
+            "price": MONTHLY_PRICE_ID,
+            "expand": ["data.customer"],
+        }
         if starting_after:
             params["starting_after"] = starting_after
         batch = stripe.Subscription.list(**params)
         for sub in batch.data:
-            items = sub["items"]["data"]
-            if not items:
-                continue
-            if items[0]["price"]["id"] != MONTHLY_PRICE_ID:
-                continue
             if sget(sub, "cancel_at_period_end", False):
                 continue
             e = sget(sub["customer"], "email", "") or ""
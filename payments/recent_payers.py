@@ -7,6 +7,7 @@ Usage:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import stripe
@@ -120,13 +121,17 @@ def main():
             }
 
     print(f'\nChecking active sub status for {len(by_customer)} customer(s)...')
+    # One Subscription.list round-trip per customer; they're independent, so
+    # run them concurrently instead of paying the latency serially. The Stripe
+    # client is thread-safe for reads.
     active = []
     inactive = []
-    for cust_id, rec in by_customer.items():
-        if has_active_chessblunders_sub(cust_id):
-            active.append(rec)
-        else:
-            inactive.append(rec)
+    cust_ids = list(by_customer)
+    if cust_ids:
+        with ThreadPoolExecutor(max_workers=min(8, len(cust_ids))) as ex:
+            results = ex.map(has_active_chessblunders_sub, cust_ids)
+        for cust_id, is_active in zip(cust_ids, results):
+            (active if is_active else inactive).append(by_customer[cust_id])
 
     username_map = get_username_map([r['email'] for r in active + inactive])
     for r in active + inactive:
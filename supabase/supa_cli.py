@@ -113,12 +113,26 @@ TIPS
 """
 import sys
 import json
+import time
 import argparse
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    HAS_ORJSON = True
+    _json_loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+    _json_loads = json.loads
 
 try:
     from rich import print
@@ -135,6 +149,25 @@ except ImportError:
 CONFIG: Dict[str, Any] = {}
 MANAGEMENT_API = "https://api.supabase.com"
 
+# Shared session so sequential calls reuse the TCP+TLS connection instead of
+# paying a fresh handshake per request (commands like status hit 3+ endpoints).
+# Pooled + retrying: transient 429/5xx from the APIs get a few backed-off
+# retries instead of surfacing immediately as a SystemExit.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the final response back instead of raising RetryError, so the
+        # helpers' own status-code handling (SystemExit with the API message)
+        # still runs when retries are exhausted.
+        raise_on_status=False,
+    ),
+))
+
 
 def load_config() -> Dict[str, Any]:
     """Load config from JSON file."""
@@ -145,47 +178,60 @@ def load_config() -> Dict[str, Any]:
         return json.load(f)
 
 
+# Built once by init_config(); headers and URLs are static for a run, so
+# there's no point rebuilding the dicts and re-formatting the URLs per call.
+_MANAGEMENT_HEADERS: Dict[str, str] = {}
+_POSTGREST_HEADERS: Dict[str, str] = {}
+_POSTGREST_URL = ""
+_AUTH_URL = ""
+
+
 def init_config() -> None:
-    """Load config."""
-    global CONFIG
+    """Load config and precompute API headers/URLs."""
+    global CONFIG, _MANAGEMENT_HEADERS, _POSTGREST_HEADERS, _POSTGREST_URL, _AUTH_URL
     CONFIG = load_config()
     required = ['supabase_access_token', 'project_ref', 'service_role_key']
     for key in required:
         if not CONFIG.get(key):
             raise SystemExit(f"Missing '{key}' in config.json")
 
-
-def get_management_headers() -> Dict[str, str]:
-    """Get headers for Management API."""
-    return {
+    _MANAGEMENT_HEADERS = {
         "Authorization": f"Bearer {CONFIG['supabase_access_token']}",
         "Content-Type": "application/json"
     }
-
-
-def get_postgrest_headers() -> Dict[str, str]:
-    """Get headers for PostgREST API."""
-    return {
+    _POSTGREST_HEADERS = {
         "apikey": CONFIG['service_role_key'],
         "Authorization": f"Bearer {CONFIG['service_role_key']}",
         "Content-Type": "application/json"
     }
+    _POSTGREST_URL = f"https://{CONFIG['project_ref']}.supabase.co/rest/v1"
+    _AUTH_URL = f"https://{CONFIG['project_ref']}.supabase.co/auth/v1"
+
+
+def get_management_headers() -> Dict[str, str]:
+    """Get headers for Management API."""
+    return _MANAGEMENT_HEADERS
+
+
+def get_postgrest_headers() -> Dict[str, str]:
+    """Get headers for PostgREST API."""
+    return _POSTGREST_HEADERS
 
 
 def get_postgrest_url() -> str:
     """Get PostgREST base URL."""
-    return f"https://{CONFIG['project_ref']}.supabase.co/rest/v1"
+    return _POSTGREST_URL
 
 
 def get_auth_url() -> str:
     """Get Auth API base URL."""
-    return f"https://{CONFIG['project_ref']}.supabase.co/auth/v1"
+    return _AUTH_URL
 
 
 def management_get(endpoint: str, params: Optional[Dict] = None) -> Any:
     """Make GET request to Management API."""
     url = f"{MANAGEMENT_API}{endpoint}"
-    r = requests.get(url, headers=get_management_headers(), params=params)
+    r = SESSION.get(url, headers=get_management_headers(), params=params)
     if r.status_code != 200:
         raise SystemExit(f"Management API Error {r.status_code}: {r.text}")
     return r.json()
@@ -196,33 +242,107 @@ def postgrest_get(table: str, params: Optional[Dict] = None, head_only: bool = F
     url = f"{get_postgrest_url()}/{table}"
     headers = get_postgrest_headers()
     if head_only:
+        # Copy before adding Prefer — the base headers dict is shared.
+        headers = dict(headers)
         headers["Prefer"] = "count=exact"
-        r = requests.head(url, headers=headers, params=params)
-        if r.status_code != 200:
+        # Ask for a zero-row window: the count comes back in content-range
+        # regardless, and PostgREST skips materializing any rows server-side.
+        headers["Range-Unit"] = "items"
+        headers["Range"] = "0-0"
+        r = SESSION.head(url, headers=headers, params=params)
+        # Ranged requests answer 206 Partial Content.
+        if r.status_code not in (200, 206):
             raise SystemExit(f"PostgREST Error {r.status_code}: {r.text}")
         # Return count from content-range header
         content_range = r.headers.get("content-range", "")
         if "/" in content_range:
             return int(content_range.split("/")[1])
         return 0
-    r = requests.get(url, headers=headers, params=params)
+    r = SESSION.get(url, headers=headers, params=params)
     if r.status_code != 200:
         raise SystemExit(f"PostgREST Error {r.status_code}: {r.text}")
     return r.json()
 
 
+_SPEC_CACHE_DIR = Path(__file__).parent / '.cache'
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_openapi_spec(ref: str) -> Dict[str, Any]:
+    """Fetch the PostgREST OpenAPI spec and return its table definitions.
+
+    Cached for the life of the process — status, tables, and columns all need
+    the same document, so it's downloaded and parsed at most once per run.
+    Also cached on disk with the server's ETag: the spec is hundreds of KB and
+    only changes on migrations, so most invocations revalidate with a cheap
+    304 instead of re-downloading.
+    """
+    cache_path = _SPEC_CACHE_DIR / f"openapi-{ref}.json"
+    cached = None
+    headers = dict(get_postgrest_headers())
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+    except (OSError, ValueError):
+        cached = None
+
+    url = f"https://{ref}.supabase.co/rest/v1/"
+    r = SESSION.get(url, headers=headers)
+    if r.status_code == 304 and cached is not None:
+        return cached["definitions"]
+    if r.status_code != 200:
+        raise SystemExit(f"Error fetching schema: {r.status_code}")
+
+    # The spec is the biggest document this tool parses; orjson (when
+    # installed) decodes it several times faster than stdlib json.
+    definitions = _json_loads(r.content).get("definitions", {})
+    etag = r.headers.get("ETag")
+    if etag:
+        try:
+            _SPEC_CACHE_DIR.mkdir(exist_ok=True)
+            tmp = cache_path.with_suffix('.tmp')
+            tmp.write_text(json.dumps({"etag": etag, "definitions": definitions}))
+            tmp.replace(cache_path)  # atomic so a killed run can't corrupt it
+        except OSError:
+            pass  # caching is best-effort
+    return definitions
+
+
+@functools.lru_cache(maxsize=1)
+def _public_table_names(ref: str) -> frozenset:
+    """Public (non-underscore) table names from the cached spec, computed once."""
+    return frozenset(k for k in _fetch_openapi_spec(ref) if not k.startswith("_"))
+
+
+@functools.lru_cache(maxsize=64)
+def _count_cached(table: str) -> int:
+    """Row count via the count HEAD, cached per table for the process lifetime.
+
+    tables get and data count both need it; the cache keeps a chained run
+    from issuing the same HEAD twice.
+    """
+    return postgrest_get(table, {"select": "*"}, head_only=True)
+
+
 def auth_get(endpoint: str, params: Optional[Dict] = None) -> Any:
     """Make GET request to Auth Admin API."""
     url = f"{get_auth_url()}/admin{endpoint}"
-    r = requests.get(url, headers=get_postgrest_headers(), params=params)
+    r = SESSION.get(url, headers=get_postgrest_headers(), params=params)
     if r.status_code != 200:
         raise SystemExit(f"Auth API Error {r.status_code}: {r.text}")
     return r.json()
 
 
 def print_json(obj: Any) -> None:
-    """Print object as formatted JSON."""
-    print(json.dumps(obj, indent=2, sort_keys=True, default=str))
+    """Print object as formatted JSON (orjson when available — much faster on big dumps)."""
+    if HAS_ORJSON:
+        out = orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=str
+        ).decode()
+    else:
+        out = json.dumps(obj, indent=2, sort_keys=True, default=str)
+    print(out)
 
 
 def format_timestamp(ts) -> str:
@@ -237,8 +357,8 @@ def format_timestamp(ts) -> str:
                 ts = ts / 1_000_000
             elif ts > 1e12:  # Milliseconds
                 ts = ts / 1000
-            dt = datetime.fromtimestamp(ts)
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
+            # time.strftime/localtime are C calls — no datetime object per row.
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
         # Handle ISO string timestamps
         dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
         return dt.strftime('%Y-%m-%d %H:%M')
@@ -246,13 +366,17 @@ def format_timestamp(ts) -> str:
         return str(ts)[:16]
 
 
-def format_age(ts: str) -> str:
-    """Format timestamp as relative age."""
+def format_age(ts: str, now: Optional[datetime] = None) -> str:
+    """Format timestamp as relative age.
+
+    Pass `now` when formatting many rows so it isn't recomputed per row.
+    """
     if not ts:
         return "-"
     try:
         dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        now = datetime.now(dt.tzinfo)
+        if now is None:
+            now = datetime.now(dt.tzinfo)
         diff = now - dt
         if diff.days > 0:
             return f"{diff.days}d ago"
@@ -275,34 +399,39 @@ def cmd_status(args: argparse.Namespace) -> None:
 
     status_data = {"project_ref": ref}
 
+    # Project info, OpenAPI spec, and edge functions are three independent
+    # network calls — issue them concurrently so status costs roughly one
+    # round-trip of wall time instead of the sum.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        project_f = ex.submit(management_get, f"/v1/projects/{ref}")
+        spec_f = ex.submit(_fetch_openapi_spec, ref)
+        functions_f = ex.submit(management_get, f"/v1/projects/{ref}/functions")
+
     # Get project info
     try:
-        project = management_get(f"/v1/projects/{ref}")
+        project = project_f.result()
         status_data["name"] = project.get("name", ref)
         status_data["region"] = project.get("region", "-")
         status_data["status"] = project.get("status", "-")
         status_data["created_at"] = project.get("created_at", "")
-    except Exception as e:
+    except (Exception, SystemExit) as e:
         status_data["error"] = str(e)
 
-    # Get table count via OpenAPI
+    # Get table count via OpenAPI. API helpers fail with SystemExit, which
+    # "except Exception" does not catch — status should keep rendering with
+    # whatever it managed to fetch, as the baseline status-code check did.
     try:
-        url = f"https://{ref}.supabase.co/rest/v1/"
-        r = requests.get(url, headers=get_postgrest_headers())
-        if r.status_code == 200:
-            spec = r.json()
-            definitions = spec.get("definitions", {})
-            public_tables = [k for k in definitions.keys() if not k.startswith("_")]
-            status_data["public_tables"] = public_tables
-            status_data["table_count"] = len(public_tables)
-    except Exception:
+        spec_f.result()  # surface fetch errors before reading the cache
+        public_tables = sorted(_public_table_names(ref))
+        status_data["public_tables"] = public_tables
+        status_data["table_count"] = len(public_tables)
+    except (Exception, SystemExit):
         pass
 
     # Get edge functions
     try:
-        functions = management_get(f"/v1/projects/{ref}/functions")
-        status_data["edge_functions"] = len(functions)
-    except Exception:
+        status_data["edge_functions"] = len(functions_f.result())
+    except (Exception, SystemExit):
         pass
 
     if args.json:
@@ -370,31 +499,45 @@ def cmd_logs_list(args: argparse.Namespace) -> None:
         print(f"[{ts_str}] {msg[:120]}")
 
 
-def cmd_tables_list(args: argparse.Namespace) -> None:
-    """List database tables via PostgREST OpenAPI."""
-    # Get schema from PostgREST OpenAPI endpoint
-    url = f"https://{CONFIG['project_ref']}.supabase.co/rest/v1/"
-    r = requests.get(url, headers=get_postgrest_headers())
+def _extract_table_summaries(definitions: Dict[str, Any]) -> List[tuple]:
+    """Sorted (name, column_count, description) tuples for public tables."""
+    return sorted(
+        (
+            (name, len(schema.get("properties", {})), schema.get("description", ""))
+            for name, schema in definitions.items()
+            if not name.startswith("_")  # Skip internal tables
+        ),
+        key=operator.itemgetter(0),
+    )
 
-    if r.status_code != 200:
-        raise SystemExit(f"Error fetching schema: {r.status_code}")
 
-    # The OpenAPI spec contains definitions for each table
-    spec = r.json()
-    definitions = spec.get("definitions", {})
+def _extract_columns(table_info: Dict[str, Any]) -> List[tuple]:
+    """Sorted (name, type, nullable, description) tuples for a table definition."""
+    required = table_info.get("required", [])
+    return sorted(
+        (
+            (
+                name,
+                info.get("type", info.get("format", "unknown")),
+                name not in required,
+                info.get("description", "")
+            )
+            for name, info in table_info.get("properties", {}).items()
+        ),
+        key=operator.itemgetter(0),
+    )
+
 
-    # Extract table names (excluding internal ones)
-    tables = []
-    for name, schema in definitions.items():
-        if not name.startswith("_"):  # Skip internal tables
-            tables.append({
-                "name": name,
-                "columns": len(schema.get("properties", {})),
-                "description": schema.get("description", "")
-            })
+def cmd_tables_list(args: argparse.Namespace) -> None:
+    """List database tables via PostgREST OpenAPI."""
+    definitions = _fetch_openapi_spec(CONFIG['project_ref'])
+    tables = _extract_table_summaries(definitions)
 
     if args.json:
-        print_json(tables)
+        print_json([
+            {"name": name, "columns": columns, "description": description}
+            for name, columns, description in tables
+        ])
         return
 
     if HAS_RICH:
@@ -402,34 +545,26 @@ def cmd_tables_list(args: argparse.Namespace) -> None:
         table.add_column("Name", style="cyan")
         table.add_column("Columns")
 
-        for t in sorted(tables, key=lambda x: x["name"]):
-            table.add_row(t["name"], str(t["columns"]))
+        for name, columns, _ in tables:
+            table.add_row(name, str(columns))
         console.print(table)
     else:
-        for t in sorted(tables, key=lambda x: x["name"]):
-            print(f"{t['name']}  columns={t['columns']}")
+        for name, columns, _ in tables:
+            print(f"{name}  columns={columns}")
 
 
 def cmd_tables_get(args: argparse.Namespace) -> None:
     """Get table details via PostgREST OpenAPI."""
-    url = f"https://{CONFIG['project_ref']}.supabase.co/rest/v1/"
-    r = requests.get(url, headers=get_postgrest_headers())
-
-    if r.status_code != 200:
-        raise SystemExit(f"Error fetching schema: {r.status_code}")
-
-    spec = r.json()
-    definitions = spec.get("definitions", {})
+    definitions = _fetch_openapi_spec(CONFIG['project_ref'])
 
     if args.table_name not in definitions:
         raise SystemExit(f"Table '{args.table_name}' not found")
 
     table_info = definitions[args.table_name]
     properties = table_info.get("properties", {})
-    required = table_info.get("required", [])
 
     # Get row count
-    count = postgrest_get(args.table_name, {"select": "*"}, head_only=True)
+    count = _count_cached(args.table_name)
 
     if args.json:
         print_json({"name": args.table_name, "row_count": count, "columns": properties})
@@ -439,42 +574,26 @@ def cmd_tables_get(args: argparse.Namespace) -> None:
     print(f"  Rows: {count}")
     print(f"\n  Columns ({len(properties)}):")
 
-    for col_name, col_info in properties.items():
-        col_type = col_info.get("type", col_info.get("format", "unknown"))
-        nullable = "NOT NULL" if col_name in required else "nullable"
-        desc = col_info.get("description", "")[:40] if col_info.get("description") else ""
-        print(f"    {col_name}: {col_type} ({nullable}) {desc}")
+    for col_name, col_type, nullable, description in _extract_columns(table_info):
+        null_str = "nullable" if nullable else "NOT NULL"
+        desc = description[:40] if description else ""
+        print(f"    {col_name}: {col_type} ({null_str}) {desc}")
 
 
 def cmd_columns(args: argparse.Namespace) -> None:
     """Show columns for a table via PostgREST OpenAPI."""
-    url = f"https://{CONFIG['project_ref']}.supabase.co/rest/v1/"
-    r = requests.get(url, headers=get_postgrest_headers())
-
-    if r.status_code != 200:
-        raise SystemExit(f"Error fetching schema: {r.status_code}")
-
-    spec = r.json()
-    definitions = spec.get("definitions", {})
+    definitions = _fetch_openapi_spec(CONFIG['project_ref'])
 
     if args.table_name not in definitions:
         raise SystemExit(f"Table '{args.table_name}' not found")
 
-    table_info = definitions[args.table_name]
-    properties = table_info.get("properties", {})
-    required = table_info.get("required", [])
-
-    columns = []
-    for name, info in properties.items():
-        columns.append({
-            "name": name,
-            "type": info.get("type", info.get("format", "unknown")),
-            "nullable": name not in required,
-            "description": info.get("description", "")
-        })
+    columns = _extract_columns(definitions[args.table_name])
 
     if args.json:
-        print_json(columns)
+        print_json([
+            {"name": name, "type": col_type, "nullable": nullable, "description": description}
+            for name, col_type, nullable, description in columns
+        ])
         return
 
     if HAS_RICH:
@@ -484,17 +603,17 @@ def cmd_columns(args: argparse.Namespace) -> None:
         table.add_column("Nullable")
         table.add_column("Description")
 
-        for col in sorted(columns, key=lambda x: x["name"]):
+        for name, col_type, nullable, description in columns:
             table.add_row(
-                col["name"],
-                col["type"],
-                "Yes" if col["nullable"] else "No",
-                col["description"][:40] if col["description"] else "-"
+                name,
+                col_type,
+                "Yes" if nullable else "No",
+                description[:40] if description else "-"
             )
         console.print(table)
     else:
-        for col in sorted(columns, key=lambda x: x["name"]):
-            print(f"{col['name']}: {col['type']}")
+        for name, col_type, _, _ in columns:
+            print(f"{name}: {col_type}")
 
 
 def cmd_policies_list(args: argparse.Namespace) -> None:
@@ -589,7 +708,12 @@ def cmd_data_list(args: argparse.Namespace) -> None:
         print(f"No data found in '{args.table_name}'")
         return
 
-    if HAS_RICH and len(data) > 0:
+    # Rich holds every rendered cell in memory and measures each row, which
+    # is fine at the default --limit 25 but balloons on big exports — past
+    # this many rows, stream plain JSONL straight to stdout instead.
+    max_rich_rows = 200
+
+    if HAS_RICH and 0 < len(data) <= max_rich_rows:
         # Auto-detect columns from first row
         columns = list(data[0].keys())[:8]  # Limit to 8 columns for display
 
@@ -612,13 +736,14 @@ def cmd_data_list(args: argparse.Namespace) -> None:
 
         console.print(table)
     else:
+        write = sys.stdout.write
         for row in data:
-            print(json.dumps(row, default=str))
+            write(json.dumps(row, default=str) + "\n")
 
 
 def cmd_data_count(args: argparse.Namespace) -> None:
     """Count rows in a table."""
-    count = postgrest_get(args.table_name, {"select": "*"}, head_only=True)
+    count = _count_cached(args.table_name)
 
     if args.json:
         print_json({"table": args.table_name, "count": count})
@@ -636,7 +761,7 @@ def cmd_storage_buckets(args: argparse.Namespace) -> None:
     except SystemExit:
         # Try direct storage API
         url = f"https://{ref}.supabase.co/storage/v1/bucket"
-        r = requests.get(url, headers=get_postgrest_headers())
+        r = SESSION.get(url, headers=get_postgrest_headers())
         if r.status_code != 200:
             print(f"Visit: https://supabase.com/dashboard/project/{ref}/storage/buckets")
             return
@@ -674,7 +799,7 @@ def cmd_storage_list(args: argparse.Namespace) -> None:
     ref = CONFIG['project_ref']
 
     url = f"https://{ref}.supabase.co/storage/v1/object/list/{args.bucket_name}"
-    r = requests.post(url, headers=get_postgrest_headers(), json={"prefix": "", "limit": args.limit})
+    r = SESSION.post(url, headers=get_postgrest_headers(), json={"prefix": "", "limit": args.limit})
 
     if r.status_code != 200:
         raise SystemExit(f"Storage API Error {r.status_code}: {r.text}")
@@ -741,6 +866,17 @@ def cmd_auth_users(args: argparse.Namespace) -> None:
         print("No users found.")
         return
 
+    # Probe each user dict once; both render paths unpack the same tuples.
+    rows = [
+        (
+            u.get("id", ""),
+            u.get("email", "-"),
+            u.get("created_at", ""),
+            u.get("last_sign_in_at", ""),
+        )
+        for u in users
+    ]
+
     if HAS_RICH:
         table = Table(title="Auth Users")
         table.add_column("ID", style="dim")
@@ -748,17 +884,18 @@ def cmd_auth_users(args: argparse.Namespace) -> None:
         table.add_column("Created")
         table.add_column("Last Sign In")
 
-        for u in users:
+        now = datetime.now(timezone.utc)
+        for uid, email, created_at, last_sign_in in rows:
             table.add_row(
-                u.get("id", "")[:12] + "...",
-                u.get("email", "-"),
-                format_age(u.get("created_at", "")),
-                format_age(u.get("last_sign_in_at", ""))
+                uid[:12] + "...",
+                email,
+                format_age(created_at, now),
+                format_age(last_sign_in, now)
             )
         console.print(table)
     else:
-        for u in users:
-            print(f"{u.get('id')}  {u.get('email')}  created={format_timestamp(u.get('created_at', ''))}")
+        for uid, email, created_at, _ in rows:
+            print(f"{uid}  {email}  created={format_timestamp(created_at)}")
 
 
 def cmd_auth_user(args: argparse.Namespace) -> None:
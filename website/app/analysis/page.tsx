@@ -10,7 +10,7 @@ import { LoadingSpinner } from "@/components/LoadingSpinner";
 import { StatCard } from "@/components/StatCard";
 import { BoardPreview } from "@/components/BoardPreview";
 import { analyzeGameClient } from "@/lib/analysis/analyzeGameClient";
-import { createStockfishNnue } from "@/lib/engines/stockfish-nnue";
+import { getSharedEngine, disposeSharedEngine } from "@/lib/engines/registry";
 import type { Engine } from "@/lib/engines/types";
 
 const ANALYSIS_DEPTH = 12;
@@ -42,15 +42,10 @@ function AnalysisContent() {
   const [analyzeProgress, setAnalyzeProgress] = useState({ current: 0, total: 0 });
   const [retentionLimitReached, setRetentionLimitReached] = useState(false);
   const abortRef = useRef(false);
+  // Warm shared engine — intentionally NOT disposed on unmount so the worker
+  // and NNUE net survive navigating away and back mid-session.
   const engineRef = useRef<Engine | null>(null);
 
-  useEffect(() => {
-    return () => {
-      engineRef.current?.dispose();
-      engineRef.current = null;
-    };
-  }, []);
-
   useEffect(() => {
     if (!authLoading && !user) {
       router.push("/");
@@ -150,11 +145,16 @@ function AnalysisContent() {
 
       // The engine runs in the user's browser — no more AWS calls.
       if (!engineRef.current) {
-        engineRef.current = createStockfishNnue();
+        engineRef.current = getSharedEngine();
       }
       try {
         await engineRef.current.ready();
       } catch {
+        // Tear down the shared instance — it caches its init promise, so a
+        // transient worker failure would otherwise stick for the whole
+        // session. The next click rebuilds the worker from scratch.
+        void disposeSharedEngine();
+        engineRef.current = null;
         toast.error("Could not start the analysis engine in this browser");
         setAnalyzing(false);
         return;
@@ -163,35 +163,12 @@ function AnalysisContent() {
       let analyzed = 0;
       let failed = 0;
 
-      // One engine instance — analyze games sequentially
-      for (let i = 0; i < unanalyzedGames.length; i++) {
-        if (abortRef.current) {
-          toast.info(`Analysis stopped. ${analyzed} games analyzed.`);
-          break;
-        }
-
-        const game = unanalyzedGames[i];
-
+      const saveBlunders = async (gameId: string, blunders: Blunder[]) => {
         try {
-          const blunders = await analyzeGameClient(
-            game.pgn,
-            game.user_color,
-            BLUNDER_THRESHOLD_CP,
-            ANALYSIS_DEPTH,
-            engineRef.current,
-            { isAborted: () => abortRef.current }
-          );
-
-          if (blunders === null) {
-            // Aborted mid-game; don't save partial results
-            toast.info(`Analysis stopped. ${analyzed} games analyzed.`);
-            break;
-          }
-
           const response = await fetch("/api/analysis/save", {
             method: "POST",
             headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({ gameId: game.id, blunders }),
+            body: JSON.stringify({ gameId, blunders }),
           });
           const result = await response.json();
 
@@ -213,6 +190,46 @@ function AnalysisContent() {
           current: startingCount + analyzed + failed,
           total: startingCount + totalToAnalyze
         });
+      };
+
+      // At most one save request in flight, overlapped with the next game's
+      // engine work — the network write costs no analysis wall-clock.
+      let pendingSave: Promise<void> | null = null;
+
+      // One engine instance — analyze games sequentially
+      for (let i = 0; i < unanalyzedGames.length; i++) {
+        if (abortRef.current) break;
+
+        const game = unanalyzedGames[i];
+
+        try {
+          const blunders = await analyzeGameClient(
+            game.pgn,
+            game.user_color,
+            BLUNDER_THRESHOLD_CP,
+            ANALYSIS_DEPTH,
+            engineRef.current,
+            { isAborted: () => abortRef.current }
+          );
+
+          if (blunders === null) {
+            // Aborted mid-game; don't save partial results
+            break;
+          }
+
+          // Let the previous save settle before queueing this one (it may
+          // have hit the retention limit and flipped the abort flag).
+          await pendingSave;
+          if (abortRef.current) break;
+
+          pendingSave = saveBlunders(game.id, blunders);
+        } catch {
+          failed++;
+          setAnalyzeProgress({
+            current: startingCount + analyzed + failed,
+            total: startingCount + totalToAnalyze
+          });
+        }
 
         // Refresh analyses list periodically
         if ((i + 1) % 5 === 0 || i + 1 >= unanalyzedGames.length) {
@@ -220,7 +237,11 @@ function AnalysisContent() {
         }
       }
 
-      if (!abortRef.current) {
+      await pendingSave;
+
+      if (abortRef.current) {
+        toast.info(`Analysis stopped. ${analyzed} games analyzed.`);
+      } else {
         toast.success(`Analysis complete! ${analyzed} games analyzed.`);
       }
 
@@ -120,27 +120,37 @@ export async function POST(request: NextRequest) {
     // Reverse to process newest months first
     archives.reverse();
 
-    // Collect games until we hit the limit
+    // Collect games until we hit the limit. Monthly archives are independent,
+    // so fetch a few in parallel per batch instead of one round trip at a
+    // time; batches stay in newest-first order so the limit cuts off the same
+    // games a serial walk would.
+    const ARCHIVE_CONCURRENCY = 4;
     const allGames: any[] = [];
 
-    for (const archiveUrl of archives) {
+    for (let i = 0; i < archives.length; i += ARCHIVE_CONCURRENCY) {
       if (allGames.length >= gameLimit) break;
 
-      const response = await fetch(archiveUrl, {
-        headers: { "User-Agent": "ChessBlunders.org/1.0" },
-      });
-
-      if (!response.ok) continue;
-
-      const data = await response.json();
-      const games = data.games || [];
+      const batch = archives.slice(i, i + ARCHIVE_CONCURRENCY);
+      const batchResults = await Promise.all(
+        batch.map(async (archiveUrl) => {
+          const response = await fetch(archiveUrl, {
+            headers: { "User-Agent": "ChessBlunders.org/1.0" },
+          });
+          if (!response.ok) return [];
+          const data = await response.json();
+          return data.games || [];
+        })
+      );
 
-      // Sort by end_time descending (newest first) and add to collection
-      games.sort((a: any, b: any) => b.end_time - a.end_time);
+      for (const games of batchResults) {
+        // Sort by end_time descending (newest first) and add to collection
+        games.sort((a: any, b: any) => b.end_time - a.end_time);
 
-      for (const game of games) {
+        for (const game of games) {
+          if (allGames.length >= gameLimit) break;
+          allGames.push(game);
+        }
         if (allGames.length >= gameLimit) break;
-        allGames.push(game);
       }
     }
 
@@ -131,8 +131,10 @@ export async function GET(request: NextRequest) {
       progressMap.set(key, p);
     });
 
-    // Flatten blunders into puzzles
+    // Flatten blunders into puzzles, accumulating filter counts in the same
+    // pass instead of re-walking the full puzzle list afterwards.
     const allPuzzles: Puzzle[] = [];
+    const counts = emptyCounts();
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     (analyses || []).forEach((rawAnalysis: any) => {
       // Handle Supabase join returning game as array
@@ -143,6 +145,12 @@ export async function GET(request: NextRequest) {
       };
       if (!analysis.blunders || analysis.blunders.length === 0) return;
 
+      // Game-level filter values are identical for every blunder in the game;
+      // compute them once per analysis (getOpeningFamily parses the PGN).
+      const resultCategory = getResultCategory(analysis.game?.result || null);
+      const timeControl = getTimeControlCategory(analysis.game?.time_class || null);
+      const openingFamily = getOpeningFamily(analysis.game?.pgn || null);
+
       analysis.blunders.forEach((blunder: Blunder, index: number) => {
         const progressKey = `${analysis.id}:${index}`;
         const progress = progressMap.get(progressKey);
@@ -159,17 +167,17 @@ export async function GET(request: NextRequest) {
           phase: getGamePhase(blunder.move_number),
           severity: getSeverity(blunder.eval_drop),
           pieceType: getPieceType(blunder.move_played),
-          resultCategory: getResultCategory(analysis.game?.result || null),
-          timeControl: getTimeControlCategory(analysis.game?.time_class || null),
-          openingFamily: getOpeningFamily(analysis.game?.pgn || null),
+          resultCategory,
+          timeControl,
+          openingFamily,
         };
 
         allPuzzles.push(puzzle);
+        addToCounts(counts, puzzle);
       });
     });
 
-    // Calculate counts before filtering
-    const counts = calculateCounts(allPuzzles);
+    counts.all = allPuzzles.length;
 
     // Apply filters
     const filteredPuzzles = allPuzzles.filter((puzzle) => {
@@ -218,8 +226,8 @@ export async function GET(request: NextRequest) {
   }
 }
 
-function calculateCounts(puzzles: Puzzle[]): FilterCounts {
-  const counts: FilterCounts = {
+function emptyCounts(): FilterCounts {
+  return {
     // Phase
     opening: 0,
     middlegame: 0,
@@ -252,7 +260,7 @@ function calculateCounts(puzzles: Puzzle[]): FilterCounts {
     month: 0,
     '3months': 0,
     year: 0,
-    all: puzzles.length,
+    all: 0,
     // Opening family
     e4: 0,
     d4: 0,
@@ -263,44 +271,42 @@ function calculateCounts(puzzles: Puzzle[]): FilterCounts {
     solvedCount: 0,
     unsolvedCount: 0,
   };
+}
 
-  puzzles.forEach((puzzle) => {
-    // Phase
-    counts[puzzle.phase as keyof FilterCounts]++;
-
-    // Severity
-    counts[puzzle.severity as keyof FilterCounts]++;
+function addToCounts(counts: FilterCounts, puzzle: Puzzle): void {
+  // Phase
+  counts[puzzle.phase as keyof FilterCounts]++;
 
-    // Time control
-    counts[puzzle.timeControl as keyof FilterCounts]++;
+  // Severity
+  counts[puzzle.severity as keyof FilterCounts]++;
 
-    // Color
-    if (puzzle.game?.user_color) {
-      counts[puzzle.game.user_color as keyof FilterCounts]++;
-    }
+  // Time control
+  counts[puzzle.timeControl as keyof FilterCounts]++;
 
-    // Result
-    counts[puzzle.resultCategory as keyof FilterCounts]++;
+  // Color
+  if (puzzle.game?.user_color) {
+    counts[puzzle.game.user_color as keyof FilterCounts]++;
+  }
 
-    // Piece type
-    counts[puzzle.pieceType as keyof FilterCounts]++;
+  // Result
+  counts[puzzle.resultCategory as keyof FilterCounts]++;
 
-    // Date range
-    if (isWithinDateRange(puzzle.game?.played_at || null, 'week')) counts.week++;
-    if (isWithinDateRange(puzzle.game?.played_at || null, 'month')) counts.month++;
-    if (isWithinDateRange(puzzle.game?.played_at || null, '3months')) counts['3months']++;
-    if (isWithinDateRange(puzzle.game?.played_at || null, 'year')) counts.year++;
+  // Piece type
+  counts[puzzle.pieceType as keyof FilterCounts]++;
 
-    // Opening family
-    counts[puzzle.openingFamily as keyof FilterCounts]++;
+  // Date range
+  if (isWithinDateRange(puzzle.game?.played_at || null, 'week')) counts.week++;
+  if (isWithinDateRange(puzzle.game?.played_at || null, 'month')) counts.month++;
+  if (isWithinDateRange(puzzle.game?.played_at || null, '3months')) counts['3months']++;
+  if (isWithinDateRange(puzzle.game?.played_at || null, 'year')) counts.year++;
 
-    // Solved
-    if (puzzle.solved) {
-      counts.solvedCount++;
-    } else {
-      counts.unsolvedCount++;
-    }
-  });
+  // Opening family
+  counts[puzzle.openingFamily as keyof FilterCounts]++;
 
-  return counts;
+  // Solved
+  if (puzzle.solved) {
+    counts.solvedCount++;
+  } else {
+    counts.unsolvedCount++;
+  }
 }
@@ -2,7 +2,7 @@
 
 import Link from "next/link";
 import { useRouter } from "next/navigation";
-import { useState, useEffect, Suspense, useCallback } from "react";
+import { useState, useEffect, Suspense, useCallback, useMemo } from "react";
 import { useAuth } from "@/lib/auth-context";
 import { Blunder } from "@/lib/supabase";
 import { FilterCounts } from "@/lib/puzzle-filters";
@@ -51,21 +51,35 @@ function formatDuration(ms: number): string {
 }
 
 
+// Move-notation conversion memo. Each conversion parses the FEN into a fresh
+// Chess instance, and uciToSan runs inside the render loop for every top move,
+// so identical (fen, move) pairs recur on each re-render of a puzzle.
+const moveConversionCache = new Map<string, string | null>();
+
 // Convert SAN move to UCI format using a chess position
 function sanToUci(fen: string, san: string): string | null {
+  const key = `s|${fen}|${san}`;
+  const cached = moveConversionCache.get(key);
+  if (cached !== undefined) return cached;
+  let uci: string | null = null;
   try {
     const game = new Chess(fen);
     const move = game.move(san);
     if (move) {
-      return move.from + move.to + (move.promotion || "");
+      uci = move.from + move.to + (move.promotion || "");
     }
   } catch {
   }
-  return null;
+  moveConversionCache.set(key, uci);
+  return uci;
 }
 
 // Convert UCI move to SAN format using a chess position
 function uciToSan(fen: string, uci: string): string | null {
+  const key = `u|${fen}|${uci}`;
+  const cached = moveConversionCache.get(key);
+  if (cached !== undefined) return cached;
+  let san: string | null = null;
   try {
     const game = new Chess(fen);
     const from = uci.slice(0, 2);
@@ -73,11 +87,12 @@ function uciToSan(fen: string, uci: string): string | null {
     const promotion = uci.length > 4 ? uci[4] : undefined;
     const move = game.move({ from, to, promotion });
     if (move) {
-      return move.san;
+      san = move.san;
     }
   } catch {
   }
-  return null;
+  moveConversionCache.set(key, san);
+  return san;
 }
 
 // Type for move rank (1 = best, 2 = second best, 3 = third best, null = not in top 3)
@@ -123,6 +138,18 @@ function getMoveRankFeedback(rank: MoveRank): { message: string; isCorrect: bool
   }
 }
 
+// Fisher-Yates shuffle. Puzzle order is randomized once per fetch so serving
+// the next puzzle is just taking the head of the list, with uniform coverage
+// and no repeat picks, instead of rolling a random index on every solve.
+function shufflePuzzles(puzzles: Puzzle[]): Puzzle[] {
+  const shuffled = [...puzzles];
+  for (let i = shuffled.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+  }
+  return shuffled;
+}
+
 // Get player side from FEN (whose turn it is)
 function getPlayerSide(fen: string): "w" | "b" {
   const parts = fen.split(" ");
@@ -321,15 +348,15 @@ function PracticeContent() {
       const res = await fetch(`/api/practice/puzzles?solved=false`);
       const data = await res.json();
 
-      setPuzzles(data.puzzles || []);
+      const shuffled = shufflePuzzles(data.puzzles || []);
+      setPuzzles(shuffled);
       setFilterCounts(data.counts || null);
       if (data.currentPracticeRun) {
         setCurrentPracticeRun(data.currentPracticeRun);
       }
 
-      // Pick a random puzzle
-      if (data.puzzles?.length > 0 && !currentPuzzle) {
-        pickRandomPuzzle(data.puzzles);
+      if (shuffled.length > 0 && !currentPuzzle) {
+        pickNextPuzzle(shuffled);
       }
     } catch (error) {
     } finally {
@@ -337,16 +364,16 @@ function PracticeContent() {
     }
   };
 
-  const pickRandomPuzzle = useCallback((availablePuzzles: Puzzle[]) => {
+  // The list is pre-shuffled, so the head is already a uniformly random pick.
+  const pickNextPuzzle = useCallback((availablePuzzles: Puzzle[]) => {
     if (availablePuzzles.length === 0) return;
 
-    const randomPuzzle =
-      availablePuzzles[Math.floor(Math.random() * availablePuzzles.length)];
+    const nextPuzzleEntry = availablePuzzles[0];
 
-    setCurrentPuzzle(randomPuzzle);
-    setCurrentAnalysisId(randomPuzzle.analysisId);
-    setCurrentBlunderIndex(randomPuzzle.blunderIndex);
-    setCurrentBlunder(randomPuzzle.blunder);
+    setCurrentPuzzle(nextPuzzleEntry);
+    setCurrentAnalysisId(nextPuzzleEntry.analysisId);
+    setCurrentBlunderIndex(nextPuzzleEntry.blunderIndex);
+    setCurrentBlunder(nextPuzzleEntry.blunder);
     setFeedback(null);
     setShowHint(false);
     setPuzzleKey(prev => prev + 1);
@@ -354,15 +381,20 @@ function PracticeContent() {
 
   const [puzzleKey, setPuzzleKey] = useState(0); // Key to force board reset
 
+  // Filter top moves based on eval gaps (same logic used for display).
+  // Moves filtered out here won't count as correct. Computed once per blunder
+  // rather than on every attempt and every render.
+  const acceptableMoves = useMemo(
+    () =>
+      currentBlunder?.top_moves && currentBlunder.top_moves.length > 0
+        ? filterTopMovesToShow(currentBlunder.top_moves.slice(0, 3))
+        : null,
+    [currentBlunder]
+  );
+
   const handleMoveResult = async (_correct: boolean, userMoveUci: string) => {
     if (!currentBlunder || !currentAnalysisId) return;
 
-    // Filter top moves based on eval gaps (same logic used for display)
-    // Moves filtered out here won't count as correct
-    const acceptableMoves = currentBlunder.top_moves && currentBlunder.top_moves.length > 0
-      ? filterTopMovesToShow(currentBlunder.top_moves.slice(0, 3))
-      : null;
-
     // Check move against filtered top moves only
     const rank = checkMoveRank(userMoveUci, currentBlunder, acceptableMoves);
     const { message, isCorrect } = getMoveRankFeedback(rank);
@@ -420,6 +452,19 @@ function PracticeContent() {
     }
   };
 
+  // While the success state is on screen, warm the move-conversion memo for
+  // the upcoming puzzle so its board and arrows render without parse work.
+  useEffect(() => {
+    if (!feedback?.correct || puzzles.length < 2) return;
+    const upcoming = puzzles.find(
+      (p) =>
+        !(p.analysisId === currentPuzzle?.analysisId && p.blunderIndex === currentPuzzle?.blunderIndex)
+    );
+    if (!upcoming) return;
+    sanToUci(upcoming.blunder.fen, upcoming.blunder.best_move);
+    sanToUci(upcoming.blunder.fen, upcoming.blunder.move_played);
+  }, [feedback, puzzles, currentPuzzle]);
+
   const nextPuzzle = () => {
     // Remove the just-solved puzzle from the array
     if (currentPuzzle) {
@@ -427,9 +472,9 @@ function PracticeContent() {
         p => !(p.analysisId === currentPuzzle.analysisId && p.blunderIndex === currentPuzzle.blunderIndex)
       );
       setPuzzles(remainingPuzzles);
-      pickRandomPuzzle(remainingPuzzles);
+      pickNextPuzzle(remainingPuzzles);
     } else {
-      pickRandomPuzzle(puzzles);
+      pickNextPuzzle(puzzles);
     }
   };
 
@@ -516,9 +561,7 @@ function PracticeContent() {
 
   // Filter top moves based on evaluation gaps (don't show much worse alternatives)
   // Used for both arrows and text display
-  const filteredTopMoves = (feedback?.correct && currentBlunder?.top_moves && currentBlunder.top_moves.length > 0)
-    ? filterTopMovesToShow(currentBlunder.top_moves.slice(0, 3))
-    : null;
+  const filteredTopMoves = feedback?.correct ? acceptableMoves : null;
 
   // Top move arrows - only show when puzzle is solved correctly
   const topMoveArrows = filteredTopMoves
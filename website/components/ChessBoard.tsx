@@ -103,13 +103,17 @@ export default function ChessBoard({
 
   // Sync game state with FEN prop
   useEffect(() => {
-    const newGame = new Chess();
-    try {
-      newGame.load(fen);
-      setGame(newGame);
-    } catch {
-      // Invalid FEN - ignore
-    }
+    setGame((prev) => {
+      // The state initializer already parsed this FEN on mount (every puzzle
+      // remounts via its key); skip building a second identical instance.
+      if (prev.fen() === fen) return prev;
+      try {
+        return new Chess(fen);
+      } catch {
+        // Invalid FEN - keep the current position
+        return prev;
+      }
+    });
     // Reset selection when FEN changes
     setSelectedSquare(null);
     setValidMoves([]);
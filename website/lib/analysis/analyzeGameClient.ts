@@ -1,4 +1,4 @@
-import { Chess } from "chess.js";
+import { Chess, type Move } from "chess.js";
 import type { Engine } from "@/lib/engines/types";
 import type { Blunder, TopMove } from "@/lib/supabase";
 
@@ -9,6 +9,7 @@ import type { Blunder, TopMove } from "@/lib/supabase";
 // the user played as black. Here both colors normalize correctly.
 
 const MATE_SCORE = 10000;
+const SEARCH_MULTIPV = 3;
 
 interface PositionEval {
   /** Centipawns from the side-to-move's perspective (UCI convention). */
@@ -22,13 +23,64 @@ function toCp(scoreCp?: number, mateIn?: number): number {
   return scoreCp ?? 0;
 }
 
+function uciOf(move: Move): string {
+  return move.from + move.to + (move.promotion || "");
+}
+
+/**
+ * Replay an already-verified move by coordinates. The verbose history gives us
+ * from/to/promotion directly, so re-parsing (and re-disambiguating) the SAN
+ * string on every replayed move is wasted work.
+ */
+function replayMove(chess: Chess, move: Move): void {
+  chess.move({ from: move.from, to: move.to, promotion: move.promotion });
+}
+
+// Transposition cache for finished searches, keyed on position + search
+// params. Openings repeat across a user's games (and within a game via
+// transpositions), so identical positions skip the engine entirely.
+// Insertion-ordered Map gives us cheap LRU eviction.
+const EVAL_CACHE_MAX = 2000;
+const evalCache = new Map<string, PositionEval>();
+
+function evalCacheKey(fen: string, depth: number, multipv: number): string {
+  // Drop the halfmove/fullmove counters: they rarely change the search result
+  // at these depths, but they make transposed positions look distinct and
+  // miss the cache. Board, side to move, castling and en passant stay.
+  const fields = fen.split(" ");
+  const position = fields.length >= 4 ? fields.slice(0, 4).join(" ") : fen;
+  return `${position}|${depth}|${multipv}`;
+}
+
+function evalCacheGet(key: string): PositionEval | undefined {
+  const hit = evalCache.get(key);
+  if (hit !== undefined) {
+    // Refresh recency so hot openings stay resident.
+    evalCache.delete(key);
+    evalCache.set(key, hit);
+  }
+  return hit;
+}
+
+function evalCachePut(key: string, value: PositionEval): void {
+  if (evalCache.size >= EVAL_CACHE_MAX) {
+    const oldest = evalCache.keys().next().value;
+    if (oldest !== undefined) evalCache.delete(oldest);
+  }
+  evalCache.set(key, value);
+}
+
 async function evaluatePosition(
   engine: Engine,
   fen: string,
-  depth: number
+  depth: number,
+  multipv: number = SEARCH_MULTIPV
 ): Promise<PositionEval | null> {
+  const key = evalCacheKey(fen, depth, multipv);
+  const cached = evalCacheGet(key);
+  if (cached) return cached;
   try {
-    const result = await engine.search(fen, { depth, multipv: 3 });
+    const result = await engine.search(fen, { depth, multipv });
     const lines = result.lines?.length
       ? result.lines
       : [{ multipv: 1, depth: result.depth ?? 0, scoreCp: result.scoreCp, mateIn: result.mateIn, pv: result.pv }];
@@ -39,11 +91,13 @@ async function evaluatePosition(
       pv: line.pv || [],
     }));
 
-    return {
+    const evaluated: PositionEval = {
       eval: toCp(lines[0].scoreCp, lines[0].mateIn),
       bestMove: topMoves[0]?.move || "",
       topMoves,
     };
+    evalCachePut(key, evaluated);
+    return evaluated;
   } catch {
     return null;
   }
@@ -60,7 +114,9 @@ async function evaluateAfterMove(
     if (chess.isCheckmate()) return { eval: -MATE_SCORE };
     return { eval: 0 }; // stalemate / draw
   }
-  const evaluated = await evaluatePosition(engine, chess.fen(), depth);
+  // Only the eval is needed here, not alternatives — searching a single PV
+  // lets the engine prune lines a MultiPV search would be forced to resolve.
+  const evaluated = await evaluatePosition(engine, chess.fen(), depth, 1);
   return evaluated ? { eval: evaluated.eval } : null;
 }
 
@@ -103,22 +159,38 @@ export async function analyzeGameClient(
     const isUserMove =
       (analyzeWhite && chess.turn() === "w") || (!analyzeWhite && chess.turn() === "b");
 
-    if (isUserMove) {
+    // With exactly one legal move there was no decision to judge — skip both
+    // searches for that position.
+    const isForced = isUserMove && chess.moves().length === 1;
+
+    if (isUserMove && !isForced) {
       if (options.isAborted?.()) return null;
 
       const fenBefore = chess.fen();
       const evalBefore = await evaluatePosition(engine, fenBefore, depth);
-      chess.move(move.san);
+      replayMove(chess, move);
 
       if (evalBefore) {
         if (options.isAborted?.()) return null;
-        const evalAfter = await evaluateAfterMove(engine, chess, depth);
 
-        if (evalAfter) {
-          // Before the user's move the user is the side to move; after it the
-          // opponent is. Normalize both to the user's perspective.
+        // If the played move heads one of the PVs we just searched, that
+        // line's score already is the post-move evaluation from the user's
+        // perspective — no need to search the resulting position again.
+        const playedUci = uciOf(move);
+        const matchedLine = evalBefore.topMoves.find((tm) => tm.move === playedUci);
+
+        let evalAfterNorm: number | null = null;
+        if (matchedLine) {
+          evalAfterNorm = matchedLine.score;
+        } else {
+          const evalAfter = await evaluateAfterMove(engine, chess, depth);
+          // After the user's move the opponent is the side to move;
+          // negate to the user's perspective.
+          if (evalAfter) evalAfterNorm = -evalAfter.eval;
+        }
+
+        if (evalAfterNorm !== null) {
           const evalBeforeNorm = evalBefore.eval;
-          const evalAfterNorm = -evalAfter.eval;
           const evalDrop = evalBeforeNorm - evalAfterNorm;
 
           if (evalDrop >= threshold) {
@@ -136,7 +208,7 @@ export async function analyzeGameClient(
         }
       }
     } else {
-      chess.move(move.san);
+      replayMove(chess, move);
     }
 
     if (chess.turn() === "w") {
@@ -11,3 +11,23 @@ export const STOCKFISH_NNUE: EngineInfo = {
 export function createEngine(): Engine {
   return createStockfishNnue();
 }
+
+let sharedEngine: Engine | null = null;
+
+/**
+ * Shared warm engine instance. Spawning the worker and loading the NNUE net
+ * takes seconds, so callers that can tolerate shared state (the analysis page)
+ * reuse one engine across page visits instead of paying startup every time.
+ */
+export function getSharedEngine(): Engine {
+  if (!sharedEngine) {
+    sharedEngine = createEngine();
+  }
+  return sharedEngine;
+}
+
+export async function disposeSharedEngine(): Promise<void> {
+  const engine = sharedEngine;
+  sharedEngine = null;
+  await engine?.dispose();
+}
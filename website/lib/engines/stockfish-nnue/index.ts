@@ -16,6 +16,23 @@ export interface StockfishNnueOptions {
   threads?: number;
 }
 
+/**
+ * Size the transposition table to the device. A bigger Hash means positions
+ * searched earlier in a game (or a batch of games) keep seeding later
+ * searches. navigator.deviceMemory is Chromium-only, so fall back to the
+ * conservative 64 MB elsewhere.
+ */
+function defaultHashMb(): number {
+  const gb =
+    typeof navigator !== "undefined"
+      ? (navigator as { deviceMemory?: number }).deviceMemory
+      : undefined;
+  if (gb === undefined) return 64;
+  if (gb >= 8) return 256;
+  if (gb >= 4) return 128;
+  return 64;
+}
+
 export function createStockfishNnue(opts: StockfishNnueOptions = {}): Engine {
   let driver: UciEngine | null = null;
   let readyPromise: Promise<void> | null = null;
@@ -32,7 +49,7 @@ export function createStockfishNnue(opts: StockfishNnueOptions = {}): Engine {
     driver = new UciEngine(worker);
     await driver.initUci();
     await driver.setOption("Threads", opts.threads ?? caps.threads);
-    await driver.setOption("Hash", opts.hashMb ?? 64);
+    await driver.setOption("Hash", opts.hashMb ?? defaultHashMb());
     // npm `stockfish` defaults Use NNUE = false (classical eval). Turn it on so
     // we actually get the NNUE strength the package name promises.
     await driver.setOption("Use NNUE", "true");
@@ -18,6 +18,11 @@ export interface IterationInfo {
 export interface SearchLimits {
   depth?: number;
   movetime?: number;
+  /**
+   * Node budget (UCI `go nodes`). Unlike movetime, the same budget searches
+   * the same tree on fast and slow hardware, so results are deterministic.
+   */
+  nodes?: number;
   /** Number of principal variations to compute (UCI MultiPV). Defaults to 1. */
   multipv?: number;
   onIteration?: (info: IterationInfo) => void;
@@ -85,29 +85,52 @@ export class UciEngine {
     this.send(`position fen ${fen}`);
 
     const infoLines: string[] = [];
+    // Single pass over the tokens — info lines arrive once per iteration per
+    // MultiPV line, so repeated indexOf scans added up at high depths.
     const parseInfo = (line: string) => {
       const tokens = line.split(/\s+/);
-      const get = (key: string): string | undefined => {
-        const i = tokens.indexOf(key);
-        return i >= 0 ? tokens[i + 1] : undefined;
-      };
-      const depth = Number(get("depth"));
-      if (!Number.isFinite(depth)) return null;
-      const nodes = Number(get("nodes"));
-      const nps = Number(get("nps"));
-      const pvIndex = Number(get("multipv"));
-      const scoreIdx = tokens.indexOf("score");
+      let depth = NaN;
+      let nodes = NaN;
+      let nps = NaN;
+      let pvIndex = NaN;
       let scoreCp: number | undefined;
       let mateIn: number | undefined;
-      if (scoreIdx >= 0) {
-        const kind = tokens[scoreIdx + 1];
-        const val = Number(tokens[scoreIdx + 2]);
-        if (kind === "cp") scoreCp = val;
-        else if (kind === "mate") mateIn = val;
+      let bound = false;
+      let pv: string[] | undefined;
+      for (let i = 0; i < tokens.length; i++) {
+        switch (tokens[i]) {
+          case "depth":
+            depth = Number(tokens[++i]);
+            break;
+          case "multipv":
+            pvIndex = Number(tokens[++i]);
+            break;
+          case "nodes":
+            nodes = Number(tokens[++i]);
+            break;
+          case "nps":
+            nps = Number(tokens[++i]);
+            break;
+          case "score": {
+            const kind = tokens[i + 1];
+            const val = Number(tokens[i + 2]);
+            if (kind === "cp") scoreCp = val;
+            else if (kind === "mate") mateIn = val;
+            i += 2;
+            break;
+          }
+          case "lowerbound":
+          case "upperbound":
+            bound = true;
+            break;
+          case "pv":
+            // The PV runs to the end of the line.
+            pv = tokens.slice(i + 1);
+            i = tokens.length;
+            break;
+        }
       }
-      const bound = tokens.includes("lowerbound") || tokens.includes("upperbound");
-      const pvIdx = tokens.indexOf("pv");
-      const pv = pvIdx >= 0 ? tokens.slice(pvIdx + 1) : undefined;
+      if (!Number.isFinite(depth)) return null;
       return {
         depth,
         multipv: Number.isFinite(pvIndex) && pvIndex > 0 ? pvIndex : 1,
@@ -149,7 +172,8 @@ export class UciEngine {
     const goParts: string[] = ["go"];
     if (limits.depth !== undefined) goParts.push("depth", String(limits.depth));
     if (limits.movetime !== undefined) goParts.push("movetime", String(limits.movetime));
-    if (limits.depth === undefined && limits.movetime === undefined) {
+    if (limits.nodes !== undefined) goParts.push("nodes", String(limits.nodes));
+    if (limits.depth === undefined && limits.movetime === undefined && limits.nodes === undefined) {
       goParts.push("depth", "12");
     }
     this.send(goParts.join(" "));